@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Benchmark login throughput at the configured password hashing parameters.
+Uses a throwaway database so it never touches data/psi.db.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import passwords
+from database import Database
+
+def main():
+    if len(sys.argv) > 3:
+        print("Usage: python bench_login.py [logins] [workers]")
+        print("Tune cost with PSI_SCRYPT_N / PSI_SCRYPT_R / PSI_SCRYPT_P")
+        sys.exit(1)
+
+    logins = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else int(os.getenv("PSI_LOGIN_WORKERS", "2"))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(os.path.join(tmp, "bench.db"))
+        db.create_user("bench", "bench-password")
+
+        # Warm up so the first scrypt call is not counted
+        db.verify_user("bench", "bench-password")
+
+        start = time.perf_counter()
+        for _ in range(logins):
+            db.verify_user("bench", "bench-password")
+        serial = time.perf_counter() - start
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            start = time.perf_counter()
+            list(pool.map(lambda _: db.verify_user("bench", "bench-password"), range(logins)))
+            pooled = time.perf_counter() - start
+
+    print(f"scrypt n={passwords.SCRYPT_N} r={passwords.SCRYPT_R} p={passwords.SCRYPT_P}")
+    print(f"serial:    {logins / serial:8.1f} logins/s  ({serial / logins * 1000:.1f} ms/login)")
+    print(f"{workers} workers: {logins / pooled:8.1f} logins/s")
+
+if __name__ == "__main__":
+    main()
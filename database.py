@@ -1,10 +1,11 @@
 import sqlite3
-import hashlib
 import secrets
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 import json
 
+from passwords import DUMMY_HASH, hash_password, needs_rehash, verify_password
+
 
 class Database:
     def __init__(self, db_path: str = "data/psi.db"):
@@ -68,12 +69,12 @@ class Database:
 
     def create_user(self, username: str, password: str, role: str = "user") -> bool:
         """Create a new user"""
-        password_hash = hashlib.sha256(password.encode()).hexdigest()
-
         # Validate role
         if role not in ["user", "admin"]:
             raise ValueError("Role must be 'user' or 'admin'")
 
+        password_hash = hash_password(password)
+
         try:
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
@@ -88,19 +89,39 @@ class Database:
             return False
 
     def verify_user(self, username: str, password: str) -> Optional[tuple]:
-        """Verify user credentials and return (user_id, role)"""
-        password_hash = hashlib.sha256(password.encode()).hexdigest()
+        """Verify user credentials and return (user_id, role)
 
+        Legacy SHA-256 hashes, and hashes made with outdated cost
+        parameters, are replaced with a fresh hash on successful login.
+        This is CPU-bound; call it off the event loop.
+        """
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         cursor.execute(
-            "SELECT id, role FROM users WHERE username = ? AND password_hash = ?",
-            (username, password_hash)
+            "SELECT id, role, password_hash FROM users WHERE username = ?",
+            (username,)
         )
         result = cursor.fetchone()
-        conn.close()
 
-        return (result[0], result[1]) if result else None
+        if result is None:
+            conn.close()
+            verify_password(password, DUMMY_HASH)
+            return None
+
+        user_id, role, password_hash = result
+        if not verify_password(password, password_hash):
+            conn.close()
+            return None
+
+        if needs_rehash(password_hash):
+            cursor.execute(
+                "UPDATE users SET password_hash = ? WHERE id = ? AND password_hash = ?",
+                (hash_password(password), user_id, password_hash)
+            )
+            conn.commit()
+
+        conn.close()
+        return (user_id, role)
 
     def create_session_token(self, user_id: int) -> str:
         """Create a new session token for user"""
@@ -0,0 +1,90 @@
+"""
+Password hashing for PSI service accounts.
+
+Hashes are salted scrypt digests stored as a self-describing string:
+
+    scrypt$<n>$<r>$<p>$<salt_hex>$<hash_hex>
+
+Cost parameters are read from the environment so they can be tuned per
+deployment. Hashes created with other parameters, and legacy unsalted
+SHA-256 hex digests, still verify and are reported by ``needs_rehash``.
+"""
+
+import hashlib
+import hmac
+import os
+import secrets
+from typing import Optional, Tuple
+
+SCRYPT_N = int(os.getenv("PSI_SCRYPT_N", str(2 ** 14)))
+SCRYPT_R = int(os.getenv("PSI_SCRYPT_R", "8"))
+SCRYPT_P = int(os.getenv("PSI_SCRYPT_P", "1"))
+SALT_BYTES = 16
+HASH_BYTES = 32
+
+_PREFIX = "scrypt"
+
+
+def _scrypt(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    # OpenSSL rejects anything above maxmem (32 MiB by default), so size it
+    # from the parameters instead of capping n at 2**14.
+    maxmem = 128 * r * (n + p + 2) + (1 << 20)
+    return hashlib.scrypt(
+        password.encode(), salt=salt, n=n, r=r, p=p, maxmem=maxmem, dklen=HASH_BYTES
+    )
+
+
+def _parse(password_hash: str) -> Optional[Tuple[int, int, int, bytes, bytes]]:
+    parts = password_hash.split("$")
+    if len(parts) != 6 or parts[0] != _PREFIX:
+        return None
+    try:
+        n, r, p = int(parts[1]), int(parts[2]), int(parts[3])
+        return n, r, p, bytes.fromhex(parts[4]), bytes.fromhex(parts[5])
+    except ValueError:
+        return None
+
+
+def _is_legacy(password_hash: str) -> bool:
+    """Unsalted SHA-256 hex digest written by earlier versions"""
+    if len(password_hash) != 64:
+        return False
+    try:
+        bytes.fromhex(password_hash)
+    except ValueError:
+        return False
+    return True
+
+
+def hash_password(password: str) -> str:
+    """Hash a password with a fresh salt and the configured cost"""
+    salt = secrets.token_bytes(SALT_BYTES)
+    digest = _scrypt(password, salt, SCRYPT_N, SCRYPT_R, SCRYPT_P)
+    return f"{_PREFIX}${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}${salt.hex()}${digest.hex()}"
+
+
+def verify_password(password: str, password_hash: str) -> bool:
+    """Check a password against a stored scrypt or legacy SHA-256 hash"""
+    parsed = _parse(password_hash)
+    if parsed is not None:
+        n, r, p, salt, expected = parsed
+        return hmac.compare_digest(_scrypt(password, salt, n, r, p), expected)
+
+    if _is_legacy(password_hash):
+        legacy = hashlib.sha256(password.encode()).hexdigest()
+        return hmac.compare_digest(legacy, password_hash.lower())
+
+    return False
+
+
+def needs_rehash(password_hash: str) -> bool:
+    """True if the hash is legacy or uses different cost parameters"""
+    parsed = _parse(password_hash)
+    if parsed is None:
+        return True
+    n, r, p, _, _ = parsed
+    return (n, r, p) != (SCRYPT_N, SCRYPT_R, SCRYPT_P)
+
+
+# Burned on unknown usernames so their response time matches a real check
+DUMMY_HASH = hash_password(secrets.token_urlsafe(16))
@@ -1,8 +1,10 @@
+import asyncio
 import json
 import os
 import subprocess
 import tempfile
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
 
@@ -21,11 +23,16 @@ PSI_REVEAL = os.getenv("PSI_REVEAL", "elements").lower()  # elements | size
 PORT = int(os.getenv("PSI_PORT", "8000"))
 HOST = os.getenv("PSI_HOST", "0.0.0.0")  # localhost, 139.91.90.9, or 0.0.0.0
 SERVER_SET_PATH = os.getenv("SERVER_SET_PATH", "/data/server_ips.txt")
+LOGIN_WORKERS = int(os.getenv("PSI_LOGIN_WORKERS", "2"))
 
 # Initialize database
 db = Database()
 security = HTTPBearer(auto_error=False)
 
+# Password hashing is CPU-bound, so logins get their own small pool instead of
+# sharing the default threadpool that serves the sync PSI endpoints.
+login_executor = ThreadPoolExecutor(max_workers=LOGIN_WORKERS, thread_name_prefix="login")
+
 
 def load_ips(path):
     seen, out = set(), []
@@ -166,18 +173,27 @@ def login_page():
     return HTMLResponse(open("static/login_clean.html").read())
 
 
-@app.post("/api/login")
-def login(username: str = Form(...), password: str = Form(...)):
-    """User login endpoint"""
+def authenticate(username: str, password: str) -> Optional[dict]:
+    """Verify credentials and issue a session token (runs in login_executor)"""
     user_data = db.verify_user(username, password)
     if user_data is None:
-        raise HTTPException(status_code=401, detail="Invalid credentials")
+        return None
 
     user_id, role = user_data
     token = db.create_session_token(user_id)
     return {"token": token, "user_id": user_id, "role": role}
 
 
+@app.post("/api/login")
+async def login(username: str = Form(...), password: str = Form(...)):
+    """User login endpoint"""
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(login_executor, authenticate, username, password)
+    if result is None:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+    return result
+
+
 @app.post("/api/logout")
 def logout(user_data: tuple = Depends(require_auth)):
     """User logout endpoint"""